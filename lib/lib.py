@@ -1,19 +1,40 @@
+import base64
+import contextlib
+import contextvars
+import functools
 import gzip
+import hashlib
+import heapq
 import json
 import os
-import platform
+import posixpath
 import shutil
 import subprocess
 import sys
 import tarfile
 import tempfile
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from http.client import (
+    HTTPConnection,
+    HTTPException,
+    HTTPResponse,
+    HTTPSConnection,
+    RemoteDisconnected,
+)
 from pathlib import Path
-from typing import Any, Callable, Literal, TypedDict, Union
-from urllib.error import URLError
-from urllib.request import Request, urlopen
+from typing import Any, BinaryIO, Callable, Iterator, Literal, TypedDict, Union
+from urllib.error import HTTPError
+from urllib.parse import unquote, urljoin, urlsplit, urlunsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+
+try:
+    from zlib_ng import zlib_ng as _zlib  # SIMD inflate/CRC32 when installed
+except ImportError:
+    import zlib as _zlib
 
 PlatformType = Literal["darwin", "linux"]
 ArchType = Literal["x86_64", "aarch64"]
@@ -27,44 +48,65 @@ class FormatKwargs(TypedDict):
     platform: str
     arch: str
     filename: str
+    filename_stem: str
     checksum_filename: str
 
 
 LibTemplate = Union[str, Callable[[FormatKwargs], str]]
 
+# progress output prefix, set per version by install_versions
+_log_prefix: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "log_prefix", default=""
+)
 
-def verify_by_sha256sum(file_path: Path, expected: str):
-    print(f"Verifying checksum for {file_path.name}...")
-    if not shutil.which("shasum") and not shutil.which("sha256sum"):
-        raise Exception("shasum or sha256sum not found")
 
-    cmd = ["shasum", "-a", "256"] if shutil.which("shasum") else ["sha256sum"]
-    result = subprocess.run([*cmd, file_path], capture_output=True, text=True)
-    actual = result.stdout.split()[0]
+def _log(message: str):
+    print(f"{_log_prefix.get()}{message}")
+
+
+_CHUNK_SIZE = 1 << 20
+
+
+def _sha256_file(file_path: Path) -> str:
+    h = hashlib.sha256()
+    with open(file_path, "rb", buffering=0) as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def verify_by_sha256sum(file_path: Path, expected: str, actual: str | None = None):
+    _log(f"Verifying checksum for {file_path.name}...")
+    if actual is None:
+        actual = _sha256_file(file_path)
 
     if actual != expected:
         raise Exception(
             f"Checksum verification failed: {actual} != {expected} for {file_path.name}"
         )
-    print("Checksum verification passed")
-
-    pass
+    _log("Checksum verification passed")
 
 
-def verify_by_sha256sum_with_checksum_path(file_path: Path, checksum_path: Path):
+def verify_by_sha256sum_with_checksum_path(
+    file_path: Path, checksum_path: Path, actual: str | None = None
+):
     with open(checksum_path) as f:
-        expected = None
-        lines = f.readlines()
-        for line in lines:
-            if file_path.name in line:
-                expected = line.split()[0]
-                break
-        if not expected and len(lines) == 1:
-            expected = lines[0].split()[0]
-        if not expected:
-            raise Exception(f"Checksum not found for {file_path.name}")
+        lines = [line.split(maxsplit=1) for line in f if line.strip()]
+
+    # "<digest>  <name>" or "<digest> *<name>" (binary mode marker), where name may
+    # carry a path such as ./foo.tar.gz or dist/foo.tar.gz
+    checksums = {
+        posixpath.basename(parts[1].strip().lstrip("*")): parts[0]
+        for parts in lines
+        if len(parts) == 2
+    }
+    expected = checksums.get(file_path.name)
+    if not expected and len(lines) == 1:
+        expected = lines[0][0]
+    if not expected:
+        raise Exception(f"Checksum not found for {file_path.name}")
 
-    verify_by_sha256sum(file_path=file_path, expected=expected)
+    verify_by_sha256sum(file_path=file_path, expected=expected, actual=actual)
 
 
 def _verify_by_minisign(
@@ -83,7 +125,7 @@ _MINISIGN_CMD = "minisign"
 def verify_by_minisign(
     public_key: str, file_path: Path, signature_path: Path, format_kwargs: FormatKwargs
 ):
-    print(f"minisign: Verifying signature for {file_path.name}...")
+    _log(f"minisign: Verifying signature for {file_path.name}...")
     if shutil.which(_MINISIGN_CMD):
         _verify_by_minisign(_MINISIGN_CMD, public_key, file_path, signature_path)
         return
@@ -96,15 +138,20 @@ def verify_by_minisign(
         bin_path = install_path / "bin" / _MINISIGN_CMD
         _verify_by_minisign(bin_path.as_posix(), public_key, file_path, signature_path)
 
-    print(f"minisign: verification passed {file_path.name}")
+    _log(f"minisign: verification passed {file_path.name}")
 
 
-publish_at_sort_version_key = lambda x: datetime.strptime(
-    x["published_at"], "%Y-%m-%dT%H:%M:%SZ"
-)
+def _compile_template(template: LibTemplate) -> Callable[[FormatKwargs], str]:
+    if callable(template):
+        return template
+    return lambda format_kwargs: template.format_map(format_kwargs)
 
 
-@dataclass(kw_only=True)
+# ISO-8601 UTC timestamps ("%Y-%m-%dT%H:%M:%SZ") sort lexicographically in time order
+publish_at_sort_version_key = lambda x: x["published_at"]
+
+
+@dataclass(kw_only=True, slots=True)
 class Plugin:
     name: str
     cmd: str
@@ -124,9 +171,67 @@ class Plugin:
     custom_checker: Callable[[Path, Path, FormatKwargs], None] | None = None
     sort_version_key: Callable[[dict], Any] = publish_at_sort_version_key
 
+    def __post_init__(self):
+        # resolve string templates once so format_template is a single call
+        self.filename_template = _compile_template(self.filename_template)
+        self.checksum_filename_template = _compile_template(
+            self.checksum_filename_template
+        )
+        self.bin_path = _compile_template(self.bin_path)
+
+
+_PLUGINS_DIR = Path(__file__).parent / "plugins"
+
+# plain-data Plugin fields a .toml plugin config may set directly
+_TOML_PLUGIN_FIELDS = {
+    "name",
+    "cmd",
+    "repo_name",
+    "filename_template",
+    "checksum_stage",
+    "checksum_filename_template",
+    "bin_path",
+    "platform_map",
+    "arch_map",
+    "is_compressed",
+}
+
+
+def _load_toml_plugin(plugin_config_path: Path) -> Plugin:
+    try:
+        import tomllib
+    except ImportError:
+        raise Exception(
+            f"{plugin_config_path.name}: TOML plugin configs require Python 3.11+"
+        )
+
+    with plugin_config_path.open("rb") as f:
+        config = tomllib.load(f)
+
+    # tag prefix stripped from / restored to versions, e.g. "v" for v1.2.3
+    version_prefix = config.pop("version_prefix", None)
+
+    unknown_keys = config.keys() - _TOML_PLUGIN_FIELDS
+    if unknown_keys:
+        raise Exception(
+            f"Unknown plugin config keys in {plugin_config_path.name}: "
+            + ", ".join(sorted(unknown_keys))
+        )
+
+    if version_prefix is not None:
+        config["recover_raw_version"] = lambda x: f"{version_prefix}{x}"
+        config["normalize_version"] = lambda x: x.removeprefix(version_prefix)
 
+    return Plugin(**config)
+
+
+@functools.lru_cache(maxsize=None)
 def get_plugin(plugin_name: str) -> Plugin:
-    plugin_config_path = Path(__file__).parent / "plugins" / f"{plugin_name}.py"
+    toml_config_path = _PLUGINS_DIR / f"{plugin_name}.toml"
+    if toml_config_path.exists():
+        return _load_toml_plugin(toml_config_path)
+
+    plugin_config_path = _PLUGINS_DIR / f"{plugin_name}.py"
 
     if not plugin_config_path.exists():
         raise Exception(f"Plugin config not found: {plugin_name}")
@@ -155,44 +260,105 @@ def list_repo_url(plugin_name: str) -> str:
     return GITHUB_URL.format(repo_name=plugin.repo_name)
 
 
+def _get_cache_dir() -> Path | None:
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if cache_home:
+        return Path(cache_home) / "asdf-fd"
+    try:
+        return Path.home() / ".cache" / "asdf-fd"
+    except RuntimeError:
+        # no HOME and no passwd entry (arbitrary container UIDs): run uncached
+        return None
+
+
+def _read_releases_cache(cache_path: Path) -> dict | None:
+    try:
+        with cache_path.open() as f:
+            cached = json.load(f)
+        if isinstance(cached.get("etag"), str) and "body" in cached:
+            return cached
+    except (OSError, ValueError, AttributeError):
+        pass
+    return None
+
+
+def _write_releases_cache(cache_path: Path, etag: str, releases: list):
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("w") as f:
+            json.dump({"etag": etag, "body": releases}, f)
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+
+
+def _fetch_releases(repo_name: str) -> list:
+    url = API_RELEASE_URL.format(repo_name=repo_name)
+    cache_dir = _get_cache_dir()
+    cache_path = (
+        cache_dir / f"{repo_name.replace('/', '__')}.releases.json"
+        if cache_dir
+        else None
+    )
+
+    # a conditional request answered with 304 has no body and is not rate limited
+    cached = _read_releases_cache(cache_path) if cache_path else None
+    headers = {"If-None-Match": cached["etag"]} if cached else {}
+
+    try:
+        with _open_url(url, headers) as response:
+            releases = json.load(response)
+            etag = response.getheader("ETag")
+    except HTTPError as e:
+        if e.code == 304 and cached:
+            return cached["body"]
+        raise
+
+    if etag and cache_path:
+        _write_releases_cache(cache_path, etag, releases)
+    return releases
+
+
 def list_version(plugin_name: str, with_published_at: bool = False) -> str:
     plugin = get_plugin(plugin_name)
-    url = API_RELEASE_URL.format(repo_name=plugin.repo_name)
 
     try:
-        with urlopen(url) as response:
-            releases = json.loads(response.read())
+        releases = _fetch_releases(plugin.repo_name)
 
-        sorted_releases = sorted(
+        recent_versions = heapq.nlargest(
+            10,
             filter(plugin.release_filter, releases),
             key=plugin.sort_version_key,
-            reverse=True,
         )
 
-        recent_versions = sorted_releases[:10]
-
         if with_published_at:
             versions = [
                 plugin.normalize_version(release["tag_name"])
                 + "#"
                 + release["published_at"]
-                for release in recent_versions
+                for release in reversed(recent_versions)
             ]
         else:
             versions = [
                 plugin.normalize_version(release["tag_name"])
-                for release in recent_versions
+                for release in reversed(recent_versions)
             ]
-        versions = list(reversed(versions))
 
         return "\n".join(versions)
 
-    except URLError as e:
+    except (OSError, HTTPException) as e:
         raise Exception(f"get version failed: {str(e)}")
 
 
+# fixed for the lifetime of the process, read once at import
+_SYSTEM = sys.platform
+# os.uname is POSIX-only, leave unsupported systems to get_system_info's error
+_MACHINE = os.uname().machine.lower() if hasattr(os, "uname") else ""
+
+
 def get_system_info() -> tuple[PlatformType, ArchType]:
-    system = platform.system().lower()
+    system = _SYSTEM
     if system == "darwin":
         plat = "darwin"
     elif system == "linux":
@@ -200,7 +366,7 @@ def get_system_info() -> tuple[PlatformType, ArchType]:
     else:
         raise Exception(f"Unsupported platform: {system}")
 
-    machine = platform.machine().lower()
+    machine = _MACHINE
     if machine in ["x86_64", "amd64"]:
         arch = "x86_64"
     elif machine in ["arm64", "aarch64"]:
@@ -216,19 +382,130 @@ def get_normalize_version(version: str) -> str:
 
 
 def format_template(template: LibTemplate, format_kwargs: FormatKwargs) -> str:
-    if callable(template):
-        return template(format_kwargs)
-    return template.format(**format_kwargs)
+    # Plugin templates are already compiled, strings only come from direct callers
+    if isinstance(template, str):
+        return template.format_map(format_kwargs)
+    return template(format_kwargs)
 
 
-def extract(download_path: Path, extract_path: Path, bin_path: str):
-    filename = download_path.name
+_ARCHIVE_SUFFIXES = (".tar.gz", ".tar.xz", ".gz", ".zip")
+
+
+def _strip_archive_suffix(filename: str) -> str:
+    for suffix in _ARCHIVE_SUFFIXES:
+        if filename.endswith(suffix):
+            return filename.removesuffix(suffix)
+    return filename
+
+
+def _get_tar_stream_mode(filename: str) -> str | None:
     if filename.endswith(".tar.gz"):
-        with tarfile.open(download_path, mode="r:gz") as tar:
-            tar.extractall(extract_path, filter="data")
-    elif filename.endswith(".tar.xz"):
-        with tarfile.open(download_path, mode="r:xz") as tar:
+        return "r|gz"
+    if filename.endswith(".tar.xz"):
+        return "r|xz"
+    return None
+
+
+_GZIP_FHCRC = 0x02
+_GZIP_FEXTRA = 0x04
+_GZIP_FNAME = 0x08
+_GZIP_FCOMMENT = 0x10
+
+
+class _GzipReader:
+    """File-like gzip decompressor over a non-seekable stream."""
+
+    def __init__(self, fileobj: BinaryIO, verify_crc: bool = True):
+        self._fileobj = fileobj
+        if verify_crc:
+            # 16 + MAX_WBITS: let zlib parse the header and check the CRC32 trailer
+            self._decompressor = _zlib.decompressobj(wbits=16 + _zlib.MAX_WBITS)
+        else:
+            # raw deflate: the trailer is never read, so no CRC32 pass
+            self._skip_header()
+            self._decompressor = _zlib.decompressobj(wbits=-_zlib.MAX_WBITS)
+        self._buffer = bytearray()
+
+    def _read_exact(self, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = self._fileobj.read(size - len(data))
+            if not chunk:
+                raise EOFError("Compressed stream ended before end-of-stream marker")
+            data += chunk
+        return data
+
+    def _skip_header(self):
+        header = self._read_exact(10)
+        if header[:3] != b"\x1f\x8b\x08":
+            raise gzip.BadGzipFile("Not a gzipped file")
+
+        flags = header[3]
+        if flags & _GZIP_FEXTRA:
+            self._read_exact(int.from_bytes(self._read_exact(2), "little"))
+        for flag in (_GZIP_FNAME, _GZIP_FCOMMENT):
+            if flags & flag:
+                while self._read_exact(1) != b"\0":
+                    pass
+        if flags & _GZIP_FHCRC:
+            self._read_exact(2)
+
+    def read(self, size: int = -1) -> bytes:
+        while (size < 0 or len(self._buffer) < size) and not self._decompressor.eof:
+            chunk = self._fileobj.read(_CHUNK_SIZE)
+            if not chunk:
+                raise EOFError("Compressed stream ended before end-of-stream marker")
+            self._buffer += self._decompressor.decompress(chunk)
+
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+
+class _LinkedMemberError(Exception):
+    # the member is a link whose target cannot be reached in a single stream pass
+    pass
+
+
+def _extract_tar(
+    fileobj: BinaryIO,
+    mode: str,
+    extract_path: Path,
+    member: str | None = None,
+    verify_crc: bool = True,
+):
+    if mode == "r|gz":
+        # inflate ourselves so zlib-ng is used when available
+        fileobj, mode = _GzipReader(fileobj, verify_crc), "r|"  # type: ignore
+
+    with tarfile.open(fileobj=fileobj, mode=mode) as tar:
+        if member is None:
             tar.extractall(extract_path, filter="data")
+            return
+
+        member = posixpath.normpath(member)
+        for tarinfo in tar:
+            if posixpath.normpath(tarinfo.name) == member:
+                if tarinfo.issym() or tarinfo.islnk():
+                    raise _LinkedMemberError(member)
+                tar.extract(tarinfo, extract_path, filter="data")
+                return
+
+
+def extract(
+    download_path: Path, extract_path: Path, bin_path: str, only_bin: bool = False
+):
+    filename = download_path.name
+    tar_mode = _get_tar_stream_mode(filename)
+    if tar_mode:
+        try:
+            with download_path.open("rb") as f:
+                _extract_tar(f, tar_mode, extract_path, bin_path if only_bin else None)
+        except _LinkedMemberError:
+            with download_path.open("rb") as f:
+                _extract_tar(f, tar_mode, extract_path)
     elif filename.endswith(".gz"):
         dst = extract_path / bin_path
         dst.parent.mkdir(parents=True, exist_ok=True)
@@ -236,37 +513,252 @@ def extract(download_path: Path, extract_path: Path, bin_path: str):
             dst.write_bytes(f_in.read())
     elif filename.endswith(".zip"):
         with zipfile.ZipFile(download_path, "r") as zip_ref:
-            zip_ref.extractall(extract_path)
+            if only_bin:
+                try:
+                    zip_ref.extract(bin_path, extract_path)
+                except KeyError:
+                    raise Exception(f"Binary file not found: {extract_path / bin_path}")
+            else:
+                zip_ref.extractall(extract_path)
     else:
         raise Exception(f"Unsupported file type: {filename}")
 
 
-def _download_file(url: str, download_path: Path):
-    print(f"Downloading {url} ...")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
+def _check_cancelled(cancel: threading.Event | None):
+    if cancel is not None and cancel.is_set():
+        raise Exception("Download cancelled")
+
+
+class _Sha256Reader:
+    """File-like wrapper that hashes everything read through it."""
+
+    def __init__(self, fileobj: BinaryIO, cancel: threading.Event | None = None):
+        self._fileobj = fileobj
+        self._sha256 = hashlib.sha256()
+        self._cancel = cancel
+
+    def read(self, size: int = -1) -> bytes:
+        _check_cancelled(self._cancel)
+        # read1 returns whatever has arrived, so cancellation is seen between packets
+        chunk = self._fileobj.read1(size)  # type: ignore
+        self._sha256.update(chunk)
+        return chunk
+
+    def hexdigest(self) -> str:
+        # consumers such as tarfile may stop before EOF (end-of-archive padding),
+        # drain the rest so the digest covers the whole payload
+        for _ in iter(lambda: self.read(_CHUNK_SIZE), b""):
+            pass
+        return self._sha256.hexdigest()
+
+
+_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+_MAX_REDIRECTS = 5
+_RETRIES = 3
+_RETRY_BACKOFF = 0.3
+# transient failures worth retrying on a fresh connection
+_RETRY_ERRORS = (ConnectionResetError, ConnectionRefusedError, RemoteDisconnected)
+
+# (scheme, netloc, proxy url or "")
+_PoolKey = tuple[str, str, str]
+
+
+def _get_proxy(scheme: str, netloc: str) -> str:
+    # same environment lookup as urlopen's default ProxyHandler
+    proxy = getproxies().get(scheme, "")
+    if not proxy or proxy_bypass(netloc):
+        return ""
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+
+def _get_proxy_headers(proxy: str) -> dict[str, str]:
+    parts = urlsplit(proxy)
+    if parts.username is None:
+        return {}
+    credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+    token = base64.b64encode(credentials.encode()).decode()
+    return {"Proxy-Authorization": f"Basic {token}"}
+
+
+class _ConnectionPool:
+    """Keep-alive connections reused across requests to the same host."""
+
+    def __init__(self):
+        self._idle: dict[_PoolKey, list[HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _connect(self, key: _PoolKey) -> HTTPConnection:
+        scheme, netloc, proxy = key
+        if not proxy:
+            if scheme == "https":
+                return HTTPSConnection(netloc)
+            return HTTPConnection(netloc)
+
+        proxy_netloc = urlsplit(proxy).netloc.rpartition("@")[2]
+        if scheme == "https":
+            conn = HTTPSConnection(proxy_netloc)
+            conn.set_tunnel(netloc, headers=_get_proxy_headers(proxy))
+            return conn
+        # plain http goes through the proxy as absolute-URI requests
+        return HTTPConnection(proxy_netloc)
+
+    def _acquire(self, key: _PoolKey) -> tuple[HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._connect(key), False
+
+    def _release(self, key: _PoolKey, conn: HTTPConnection):
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _send(
+        self, key: _PoolKey, target: str, headers: dict[str, str]
+    ) -> tuple[HTTPConnection, HTTPResponse]:
+        attempt = 0
+        while True:
+            conn, reused = self._acquire(key)
+            try:
+                conn.request("GET", target, headers=headers)
+                return conn, conn.getresponse()
+            except (ConnectionError, RemoteDisconnected) as e:
+                conn.close()
+                if reused:
+                    # the server closed an idle keep-alive socket, retry right away
+                    continue
+                if not isinstance(e, _RETRY_ERRORS) or attempt == _RETRIES:
+                    raise
+            time.sleep(_RETRY_BACKOFF * (2**attempt))
+            attempt += 1
+
+    @contextlib.contextmanager
+    def request(
+        self, url: str, headers: dict[str, str] | None = None
+    ) -> Iterator[HTTPResponse]:
+        headers = {"User-Agent": _USER_AGENT, **(headers or {})}
+        for _ in range(_MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            proxy = _get_proxy(parts.scheme, parts.netloc)
+            key = (parts.scheme, parts.netloc, proxy)
+
+            if proxy and parts.scheme == "http":
+                target = urlunsplit(parts._replace(fragment=""))
+                request_headers = {**headers, **_get_proxy_headers(proxy)}
+            else:
+                target = parts.path or "/"
+                if parts.query:
+                    target += "?" + parts.query
+                request_headers = headers
+
+            conn, response = self._send(key, target, request_headers)
+            location = response.getheader("Location")
+            if response.status in _REDIRECT_STATUSES and location:
+                response.read()
+                self._release(key, conn)
+                url = urljoin(url, location)
+                continue
+
+            # match urlopen, which also raises for 304 Not Modified
+            if not 200 <= response.status < 300:
+                conn.close()
+                raise HTTPError(
+                    url, response.status, response.reason, response.headers, None
+                )
+
+            try:
+                yield response
+            finally:
+                # only a fully consumed response leaves the connection reusable
+                if response.isclosed():
+                    self._release(key, conn)
+                else:
+                    conn.close()
+            return
+
+        raise HTTPError(
+            url, response.status, "Too many redirects", response.headers, None
+        )
 
-    req = Request(url=url, headers=headers)
 
-    with urlopen(req) as response:
-        download_path.write_bytes(response.read())
+# only install-many issues enough sequential requests to the same hosts for
+# keep-alive to pay off, a single install or list runs in its own process
+_http: _ConnectionPool | None = None
 
 
-def _get_github_api_checker(file_path: Path, format_kwargs: FormatKwargs):
-    print(f"_get_github_api_checker: file_path: {file_path}")
-    tag_url = API_TAG_INFO_URL.format(**format_kwargs)
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
+@contextlib.contextmanager
+def _pooled_connections() -> Iterator[None]:
+    global _http
+    _http = _ConnectionPool()
+    try:
+        yield
+    finally:
+        pool, _http = _http, None
+        pool.close()
+
+
+def _open_url(url: str, headers: dict[str, str] | None = None):
+    if _http is not None:
+        return _http.request(url, headers)
+    request = Request(url=url, headers={"User-Agent": _USER_AGENT, **(headers or {})})
+    return urlopen(request)
+
+
+def _download_file(
+    url: str, download_path: Path, cancel: threading.Event | None = None
+) -> str:
+    _log(f"Downloading {url} ...")
+    h = hashlib.sha256()
+    with _open_url(url) as response, download_path.open("wb") as f:
+        for chunk in iter(lambda: response.read1(_CHUNK_SIZE), b""):
+            _check_cancelled(cancel)
+            h.update(chunk)
+            f.write(chunk)
+
+    return h.hexdigest()
+
+
+def _download_and_extract_tar(
+    url: str,
+    mode: str,
+    extract_path: Path,
+    member: str | None = None,
+    verify_crc: bool = True,
+    cancel: threading.Event | None = None,
+) -> str:
+    _log(f"Downloading and extracting {url} ...")
+    try:
+        with _open_url(url) as response:
+            reader = _Sha256Reader(response, cancel)
+            _extract_tar(reader, mode, extract_path, member, verify_crc)  # type: ignore
+            return reader.hexdigest()
+    except _LinkedMemberError:
+        # the stream cannot be rewound, fetch it again for a full extraction
+        _log(f"{member} is a link, extracting the whole archive ...")
+        return _download_and_extract_tar(
+            url, mode, extract_path, verify_crc=verify_crc, cancel=cancel
+        )
 
-    req = Request(url=tag_url, headers=headers)
 
-    with urlopen(req) as response:
+def _get_github_api_checker(
+    file_path: Path, format_kwargs: FormatKwargs, actual: str | None = None
+):
+    _log(f"_get_github_api_checker: file_path: {file_path}")
+    tag_url = API_TAG_INFO_URL.format(**format_kwargs)
+
+    with _open_url(tag_url) as response:
         if response.status != 200:
             raise Exception(f"{tag_url} status: {response.status}")
 
-        data = json.loads(response.read())
+        data = json.load(response)
         filename = file_path.name
         api_sha256sum = None
 
@@ -278,46 +770,57 @@ def _get_github_api_checker(file_path: Path, format_kwargs: FormatKwargs):
         if not api_sha256sum:
             raise Exception(f"{tag_url} digest is null")
 
-        verify_by_sha256sum(file_path=file_path, expected=api_sha256sum)
+        verify_by_sha256sum(file_path=file_path, expected=api_sha256sum, actual=actual)
+
+
+def _get_checksum_url(checksum_filename: str, format_kwargs: FormatKwargs) -> str:
+    if not checksum_filename or checksum_filename == GITHUB_CHECKER_FLAG:
+        return ""
+
+    return (
+        checksum_filename
+        if checksum_filename.startswith("https")
+        else CHECKSUM_URL.format(
+            **format_kwargs,
+        )
+    )
 
 
 def _get_checker(
     plugin: Plugin,
-    download_dir: Path,
+    checksum_path: Path | None,
     checksum_filename: str,
     format_kwargs: FormatKwargs,
-) -> Callable[[Path], None]:
+) -> Callable[[Path, str | None], None]:
     if not checksum_filename:
-        return lambda _: None
+        return lambda _, __: None
 
     if checksum_filename == GITHUB_CHECKER_FLAG:
-        return lambda file_path: _get_github_api_checker(
-            file_path=file_path, format_kwargs=format_kwargs
+        return lambda file_path, actual: _get_github_api_checker(
+            file_path=file_path, format_kwargs=format_kwargs, actual=actual
         )
 
-    checksum_url = (
-        checksum_filename
-        if checksum_filename.startswith("https")
-        else CHECKSUM_URL.format(
-            **format_kwargs,
-        )
-    )
-    checksum_path = download_dir / Path(checksum_filename).name
-    _download_file(url=checksum_url, download_path=checksum_path)
+    if checksum_path is None:
+        raise Exception(f"Checksum file not downloaded: {checksum_filename}")
 
     if plugin.custom_checker:
-        checker = lambda file_path: plugin.custom_checker(
+        checker = lambda file_path, _: plugin.custom_checker(
             file_path, checksum_path, format_kwargs
         )  # type: ignore
     else:
-        checker = lambda file_path: verify_by_sha256sum_with_checksum_path(
-            file_path, checksum_path
+        checker = lambda file_path, actual: verify_by_sha256sum_with_checksum_path(
+            file_path, checksum_path, actual
         )
 
     return checker
 
 
-def install_version(plugin_name: str, normalize_version: str, install_path: str):
+def install_version(
+    plugin_name: str,
+    normalize_version: str,
+    install_path: str,
+    cancel: threading.Event | None = None,
+):
     plugin = get_plugin(plugin_name)
     plat, arch = get_system_info()
 
@@ -334,11 +837,13 @@ def install_version(plugin_name: str, normalize_version: str, install_path: str)
         "platform": platform_name,
         "arch": arch_name,
         "filename": "",
+        "filename_stem": "",
         "checksum_filename": "",
     }
 
     filename = format_template(plugin.filename_template, format_kwargs)
     format_kwargs["filename"] = filename
+    format_kwargs["filename_stem"] = _strip_archive_suffix(Path(filename).name)
     checksum_filename = format_template(
         plugin.checksum_filename_template, format_kwargs
     )
@@ -349,40 +854,99 @@ def install_version(plugin_name: str, normalize_version: str, install_path: str)
     download_url = (
         filename if filename.startswith("https") else BINARY_URL.format(**format_kwargs)
     )
+    checksum_url = _get_checksum_url(checksum_filename, format_kwargs)
 
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_path = Path(tmp_dir)
         download_path = tmp_path / Path(filename).name
+        checksum_path = (
+            tmp_path / Path(checksum_filename).name if checksum_url else None
+        )
+
+        extract_path = tmp_path / "extract"
+        extract_path.mkdir(exist_ok=True)
+
+        tar_mode = _get_tar_stream_mode(filename) if plugin.is_compressed else None
+        # a custom checker needs the archive on disk, otherwise only its digest is
+        # needed and the tarball can be extracted straight from the response
+        stream_extract = tar_mode is not None and not (
+            plugin.custom_checker and plugin.checksum_stage == "download"
+        )
 
-        _download_file(url=download_url, download_path=download_path)
+        # the default copy only needs the binary, skip the rest of the archive
+        only_bin = plugin.custom_copy is None
+
+        if cancel is None:
+            cancel = threading.Event()
+        if stream_extract:
+            download = functools.partial(
+                _download_and_extract_tar,
+                url=download_url,
+                mode=tar_mode,
+                extract_path=extract_path,
+                member=bin_path if only_bin else None,
+                # the archive sha256 is verified, gzip's CRC32 adds nothing
+                verify_crc=not (
+                    checksum_filename and plugin.checksum_stage == "download"
+                ),
+                cancel=cancel,
+            )
+        else:
+            download = functools.partial(
+                _download_file,
+                url=download_url,
+                download_path=download_path,
+                cancel=cancel,
+            )
+
+        if not checksum_path:
+            download_sha256 = download()
+        else:
+            # the binary and its checksum file are independent, fetch them together
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                download_future = executor.submit(
+                    contextvars.copy_context().run, download
+                )
+                try:
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        _download_file,
+                        url=checksum_url,
+                        download_path=checksum_path,
+                        cancel=cancel,
+                    ).result()
+                    download_sha256 = download_future.result()
+                except BaseException:
+                    # a failed checksum fetch or Ctrl-C must not wait for the
+                    # other download to finish before exiting the executor
+                    cancel.set()
+                    raise
 
         checker = _get_checker(
             plugin=plugin,
-            download_dir=tmp_path,
+            checksum_path=checksum_path,
             checksum_filename=checksum_filename,
             format_kwargs=format_kwargs,
         )
 
         if plugin.checksum_stage == "download":
-            checker(download_path)
+            checker(download_path, download_sha256)
 
-        extract_path = tmp_path / "extract"
-        extract_path.mkdir(exist_ok=True)
-
-        if plugin.is_compressed:
+        if not plugin.is_compressed:
+            download_path.replace(extract_path / bin_path)
+        elif not stream_extract:
             extract(
                 download_path=download_path,
                 extract_path=extract_path,
                 bin_path=bin_path,
+                only_bin=only_bin,
             )
-        else:
-            shutil.copy2(download_path, extract_path / bin_path)
 
         if plugin.checksum_stage == "extract":
-            checker(extract_path / bin_path)
+            checker(extract_path / bin_path, None)
 
         if not plugin.custom_copy:
-            print(f"{plugin.name}: Using default copy function...")
+            _log(f"{plugin.name}: Using default copy function...")
             src = extract_path / bin_path
             if not src.exists():
                 raise Exception(f"Binary file not found: {src}")
@@ -391,13 +955,77 @@ def install_version(plugin_name: str, normalize_version: str, install_path: str)
             dst.mkdir(parents=True, exist_ok=True)
             dst = dst / plugin.cmd
 
-            shutil.copy2(src, dst)
+            shutil.copyfile(src, dst)
             dst.chmod(0o755)
         else:
-            print(f"{plugin.name} Using custom copy function...")
+            _log(f"{plugin.name} Using custom copy function...")
             plugin.custom_copy(plugin, extract_path, Path(install_path), format_kwargs)
 
-    print(f"{plugin.name} Installation completed successfully!")
+    _log(f"{plugin.name} Installation completed successfully!")
+
+
+# concurrent installs beyond this mostly add GitHub throttling and errors
+_INSTALL_CONCURRENCY = 4
+
+
+def _install_version_labelled(
+    plugin_name: str,
+    normalize_version: str,
+    install_path: str,
+    cancel: threading.Event,
+):
+    # concurrent installs interleave their output, tag each line with the version
+    _log_prefix.set(f"[{normalize_version}] ")
+    install_version(plugin_name, normalize_version, install_path, cancel)
+
+
+def install_versions(
+    plugin_name: str, normalize_versions: list[str], install_root: str
+):
+    # installing the same version twice at once would race on one directory
+    normalize_versions = list(dict.fromkeys(normalize_versions))
+    for version in normalize_versions:
+        # each version becomes a directory name under install_root
+        if version in ("", ".", "..") or os.path.basename(version) != version:
+            raise Exception(f"Invalid version: {version}")
+
+    # load the plugin once up front, the cached config is shared by every install
+    get_plugin(plugin_name)
+
+    failed = []
+    cancels = {version: threading.Event() for version in normalize_versions}
+    with (
+        _pooled_connections(),
+        ThreadPoolExecutor(max_workers=_INSTALL_CONCURRENCY) as executor,
+    ):
+        futures = {
+            version: executor.submit(
+                contextvars.copy_context().run,
+                _install_version_labelled,
+                plugin_name,
+                version,
+                os.path.join(install_root, version),
+                cancels[version],
+            )
+            for version in normalize_versions
+        }
+        try:
+            for version, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"{plugin_name} {version}: installation failed: {e}")
+                    failed.append(version)
+        except KeyboardInterrupt:
+            # drop queued installs and abort running downloads, so leaving the
+            # executor does not wait for every in-flight install to finish
+            for version, future in futures.items():
+                future.cancel()
+                cancels[version].set()
+            raise
+
+    if failed:
+        raise Exception(f"Failed to install {plugin_name}: {', '.join(failed)}")
 
 
 def main():
@@ -405,6 +1033,7 @@ def main():
         print("Usage:")
         print("  list <plugin_name>")
         print("  install <plugin_name> <version> <install_path>")
+        print("  install-many <plugin_name> <version,version,...> <install_root>")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -419,9 +1048,18 @@ def main():
         version = sys.argv[3]
         install_path = os.path.abspath(sys.argv[4])
         install_version(plugin_name, version, install_path)
+    elif command == "install-many":
+        if len(sys.argv) != 5:
+            print(
+                "Usage: install-many <plugin_name> <version,version,...> <install_root>"
+            )
+            sys.exit(1)
+        versions = [version for version in sys.argv[3].split(",") if version]
+        install_root = os.path.abspath(sys.argv[4])
+        install_versions(plugin_name, versions, install_root)
     else:
         print(f"Unknown command: {command}")
-        print("Available commands: list, install")
+        print("Available commands: list, install, install-many")
         sys.exit(1)
 
 